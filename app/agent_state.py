@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 
 SLOT_NAMES = [
@@ -12,8 +12,11 @@ SLOT_NAMES = [
     "gender",
 ]
 
+# Sentinel distinguishing "slot name unknown" from a stored None value.
+_MISSING = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentState:
     """
     Deterministic agent memory.
@@ -26,7 +29,8 @@ class AgentState:
         default_factory=lambda: {name: None for name in SLOT_NAMES}
     )
 
-    confirmed_slots: List[str] = field(default_factory=list)
+    # Set: confirming the same slot twice is idempotent, membership is O(1).
+    confirmed_slots: Set[str] = field(default_factory=set)
     contradictions: List[str] = field(default_factory=list)
 
     eligibility_checked: bool = False
@@ -56,14 +60,14 @@ def update_state_from_nlu(state: AgentState, nlu_result: Dict[str, Any]) -> None
 
     # (b) Update slots + contradictions
     for slot_name, new_value in slots.items():
-        if slot_name not in state.slots:
-            continue
-
         if new_value is None:
             # Do not overwrite an existing value with null
             continue
 
-        current_value = state.slots[slot_name]
+        # Single lookup: distinguishes "unknown slot" from "slot is None".
+        current_value = state.slots.get(slot_name, _MISSING)
+        if current_value is _MISSING:
+            continue
 
         if current_value is not None and current_value != new_value:
             # Contradiction
@@ -71,6 +75,6 @@ def update_state_from_nlu(state: AgentState, nlu_result: Dict[str, Any]) -> None
         else:
             # First time we see this slot or same value again
             state.slots[slot_name] = new_value
-            state.confirmed_slots.append(slot_name)
+            state.confirmed_slots.add(slot_name)
 
 
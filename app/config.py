@@ -4,6 +4,9 @@ SAMPLE_RATE = 16_000
 # Based on runtime logs, typical speech energy ~0.004–0.006 and noise ~1e-5,
 # so set threshold safely between them so speech is "non-silent".
 SILENCE_THRESHOLD = 0.0005
+# Squared once at import: the audio callback compares mean-square block
+# energy, so thresholding needs the squared value (units are amplitude²).
+SILENCE_THRESHOLD_SQ = SILENCE_THRESHOLD * SILENCE_THRESHOLD
 SILENCE_DURATION = 1.2
 CHUNK_DURATION = 0.2
 MAX_RECORD_TIME = 10.0
@@ -1,8 +1,9 @@
-from dataclasses import asdict
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from app.agent_state import AgentState, SLOT_NAMES
+from app.services.documents import check_document_readiness
 
 
 class PlannerAction(str, Enum):
@@ -30,34 +31,60 @@ SCHEME_REQUIRED_SLOTS: Dict[str, List[str]] = {
 }
 
 
-def get_candidate_schemes(state: AgentState) -> List[str]:
-    """
-    Stage 1: Narrow down candidate schemes based on already known slots.
-    
-    This prevents asking irrelevant questions (e.g., asking a 65-year-old male
-    if they are pregnant).
-    
-    Returns:
-        List of scheme names that are still viable given current slot values.
-    """
+@lru_cache(maxsize=64)
+def _candidate_schemes(age, is_farmer, gender) -> Tuple[str, ...]:
+    """Pure candidate computation over the three slots that matter."""
     candidates = []
-    
+
     # IGNOAPS: Old Age Pension - requires age >= 60
-    age = state.slots.get("age")
     if age is not None and age >= 60:
         candidates.append("IGNOAPS")
-    
+
     # PM-KISAN: Farmer scheme - exclude only if explicitly False
-    is_farmer = state.slots.get("is_landholding_farmer")
     if is_farmer is not False:  # None or True both allow consideration
         candidates.append("PM-KISAN")
-    
+
     # PMMVY: Maternity scheme - only for females
-    gender = state.slots.get("gender")
     if gender == "female":
         candidates.append("PMMVY")
-    
-    return candidates
+
+    return tuple(candidates)
+
+
+def get_candidate_schemes(state: AgentState) -> List[str]:
+    """
+    Stage 1: Narrow down candidate schemes based on already known slots.
+
+    This prevents asking irrelevant questions (e.g., asking a 65-year-old male
+    if they are pregnant).
+
+    Only age, farmer status, and gender influence candidacy, so the result
+    is cached on those three values.
+
+    Returns:
+        List of scheme names that are still viable given current slot values.
+    """
+    slots = state.slots
+    return list(
+        _candidate_schemes(
+            slots.get("age"),
+            slots.get("is_landholding_farmer"),
+            slots.get("gender"),
+        )
+    )
+
+
+@lru_cache(maxsize=16)
+def _required_slots_for(schemes_key: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Merged required slots for a scheme combination, computed once."""
+    # dict.fromkeys dedupes in O(N) while preserving first-seen order.
+    return tuple(
+        dict.fromkeys(
+            slot
+            for scheme in schemes_key
+            for slot in SCHEME_REQUIRED_SLOTS.get(scheme, ())
+        )
+    )
 
 
 def get_required_slots_for_schemes(
@@ -67,14 +94,12 @@ def get_required_slots_for_schemes(
     Compute the set of slots required for the schemes the planner is considering.
 
     If no schemes are provided, we conservatively use all known schemes.
+
+    The scheme combinations seen in practice are a handful of fixed lists,
+    so the merge is memoized on the (order-preserving) scheme tuple.
     """
     schemes = target_schemes or list(SCHEME_REQUIRED_SLOTS.keys())
-    required: List[str] = []
-    for scheme in schemes:
-        for slot in SCHEME_REQUIRED_SLOTS.get(scheme, []):
-            if slot not in required:
-                required.append(slot)
-    return required
+    return list(_required_slots_for(tuple(schemes)))
 
 
 def get_missing_slots(state: AgentState, required_slots: List[str]) -> List[str]:
@@ -88,15 +113,42 @@ def get_missing_slots(state: AgentState, required_slots: List[str]) -> List[str]
     return missing
 
 
+def first_missing_slot(state: AgentState, required_slots: List[str]) -> Optional[str]:
+    """First required slot still None, without materializing the full list."""
+    return next((s for s in required_slots if state.slots.get(s) is None), None)
+
+
 def choose_next_missing_slot(missing_slots: List[str]) -> Optional[str]:
     """Deterministic choice of which slot to ask for next."""
     return missing_slots[0] if missing_slots else None
 
 
+def _decision_key(state: AgentState, stt_confidence: float, debug: bool) -> Tuple:
+    """Hashable snapshot of everything the decision table reads."""
+    return (
+        debug,
+        stt_confidence < 0.3,
+        state.intent,
+        tuple(sorted((k, v) for k, v in state.slots.items() if v is not None)),
+        state.eligibility_checked,
+        tuple(state.contradictions),
+        tuple(state.documents.items()),
+        state.application_started,
+    )
+
+
+# Memoized (action, info) results; the planner is deterministic in its
+# inputs, so repeat invocations with unchanged state are dict lookups.
+_DECISION_CACHE: Dict[Tuple, Tuple[PlannerAction, Dict]] = {}
+_DECISION_CACHE_MAX = 256
+
+
 def decide_next_action(
     state: AgentState,
     stt_confidence: float,
     target_schemes: Optional[List[str]] = None,
+    *,
+    debug: bool = False,
 ) -> Tuple[PlannerAction, Dict]:
     """
     Deterministic planner implementing the decision table.
@@ -104,72 +156,88 @@ def decide_next_action(
     Returns:
       (action, info_dict)
       - info_dict may contain helper data like missing_slots, chosen_slot, etc.
+      - diagnostic-only entries (candidate/complete/required/missing lists)
+        are populated only when debug=True; the keys the caller acts on
+        (next_slot, contradictions, next_document, ...) are always present.
     """
+    key = _decision_key(state, stt_confidence, debug)
+    cached = _DECISION_CACHE.get(key)
+    if cached is None:
+        if len(_DECISION_CACHE) >= _DECISION_CACHE_MAX:
+            _DECISION_CACHE.clear()
+        cached = _DECISION_CACHE[key] = _decide(state, stt_confidence, debug)
+    action, info = cached
+    state.last_action = action.value
+    # Shallow copy so callers can annotate info without poisoning the cache.
+    return action, dict(info)
+
+
+def _decide(
+    state: AgentState,
+    stt_confidence: float,
+    debug: bool = False,
+) -> Tuple[PlannerAction, Dict]:
+    """Uncached decision table; must not mutate state."""
     info: Dict = {}
 
     # 1. STT confidence check
     if stt_confidence < 0.3:
-        action = PlannerAction.REPEAT_INPUT
-        state.last_action = action.value
         info["reason"] = "low_stt_confidence"
-        return action, info
+        return PlannerAction.REPEAT_INPUT, info
 
     # 2. Contradictions
     if state.contradictions:
-        action = PlannerAction.HANDLE_CONTRADICTION
-        state.last_action = action.value
         info["contradictions"] = list(state.contradictions)
-        return action, info
+        return PlannerAction.HANDLE_CONTRADICTION, info
 
     # 3. FIND_ELIGIBLE_SCHEME flow
     if state.intent == "FIND_ELIGIBLE_SCHEME":
         # Stage 1: Filter to candidate schemes based on known slots
         candidate_schemes = get_candidate_schemes(state)
-        info["candidate_schemes"] = candidate_schemes
-        
+
         # If no candidates yet, we may need more info to narrow down
         if not candidate_schemes:
             # Could ask for age or gender to narrow down, but for now
             # we'll use all schemes as fallback (conservative)
             candidate_schemes = list(SCHEME_REQUIRED_SLOTS.keys())
-            info["candidate_schemes"] = candidate_schemes
             info["note"] = "no_candidates_yet_using_all"
-        
+        if debug:
+            info["candidate_schemes"] = candidate_schemes
+
         # Stage 2: Check if ANY candidate scheme has all required slots
         # If so, prioritize checking eligibility for that scheme
         complete_schemes = []
         for scheme in candidate_schemes:
             required_for_scheme = SCHEME_REQUIRED_SLOTS.get(scheme, [])
-            missing_for_scheme = get_missing_slots(state, required_for_scheme)
-            if not missing_for_scheme:
+            if first_missing_slot(state, required_for_scheme) is None:
                 complete_schemes.append(scheme)
-        
-        info["complete_schemes"] = complete_schemes
-        
+
+        if debug:
+            info["complete_schemes"] = complete_schemes
+
         # If we have at least one complete scheme, check eligibility
         if complete_schemes:
             if not state.eligibility_checked:
                 action = PlannerAction.CHECK_ELIGIBILITY
             else:
                 action = PlannerAction.RESPOND_RESULT
-            state.last_action = action.value
             return action, info
         
         # Otherwise, check missing slots across all candidate schemes
         required = get_required_slots_for_schemes(candidate_schemes)
-        missing = get_missing_slots(state, required)
-        info["required_slots"] = required
-        info["missing_slots"] = missing
+        next_slot = first_missing_slot(state, required)
+        if debug:
+            info["required_slots"] = required
+            info["missing_slots"] = get_missing_slots(state, required)
 
-        if missing:
+        if next_slot is not None:
             action = PlannerAction.ASK_MISSING_SLOT
-            info["next_slot"] = choose_next_missing_slot(missing)
+            info["next_slot"] = next_slot
         elif not state.eligibility_checked:
             action = PlannerAction.CHECK_ELIGIBILITY
         else:
             action = PlannerAction.RESPOND_RESULT
 
-        state.last_action = action.value
         return action, info
 
     # 4. APPLY_FOR_SCHEME flow
@@ -181,8 +249,6 @@ def decide_next_action(
             action = PlannerAction.CHECK_DOCUMENTS
         else:
             # Check document readiness
-            from app.services.documents import check_document_readiness
-            
             doc_status = check_document_readiness(state.documents)
             
             if doc_status["status"] == "checking":
@@ -202,14 +268,11 @@ def decide_next_action(
             else:
                 action = PlannerAction.CHECK_DOCUMENTS
 
-        state.last_action = action.value
         return action, info
 
     # Fallback: treat as missing information
-    action = PlannerAction.ASK_MISSING_SLOT
-    state.last_action = action.value
     info["reason"] = "unhandled_intent_or_none"
-    return action, info
+    return PlannerAction.ASK_MISSING_SLOT, info
 
 
 def summarize_turn(
@@ -0,0 +1,43 @@
+"""Shared, cached access to schemes.json.
+
+Both the eligibility engine and the document checker need the scheme
+catalog; loading it here once per process avoids re-reading and
+re-parsing the JSON file on every planner turn.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+
+def _schemes_path() -> str:
+    """Return the absolute path to schemes.json (in app/ directory)."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    app_dir = os.path.dirname(current_dir)
+    return os.path.join(app_dir, "schemes.json")
+
+
+@lru_cache(maxsize=1)
+def get_schemes() -> List[Dict[str, Any]]:
+    """Load schemes from schemes.json, parsed once per process."""
+    with open(_schemes_path(), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    schemes = data.get("schemes", [])
+    for scheme in schemes:
+        # Precomputed at load so eligibility checks can test field
+        # availability with one set operation instead of a Python loop.
+        required = scheme.get("eligibility", {}).get("required_fields", [])
+        scheme["_required_fields_set"] = frozenset(required)
+    return schemes
+
+
+@lru_cache(maxsize=1)
+def _schemes_by_id() -> Dict[str, Dict[str, Any]]:
+    """Index of scheme_id -> scheme dict, built once on first use."""
+    return {scheme["scheme_id"]: scheme for scheme in get_schemes()}
+
+
+def get_scheme_by_id(scheme_id: str) -> Optional[Dict[str, Any]]:
+    """Return the scheme with the given scheme_id, or None if unknown."""
+    return _schemes_by_id().get(scheme_id)
@@ -1,15 +1,12 @@
 """Mock application submission for welfare schemes."""
 
 import random
-import string
 from typing import Any, Dict
 
 
 def generate_application_id() -> str:
     """Generate a mock application ID."""
-    prefix = "TN-APP-"
-    suffix = "".join(random.choices(string.digits, k=5))
-    return f"{prefix}{suffix}"
+    return f"TN-APP-{random.randrange(100000):05d}"
 
 
 def apply_for_scheme(
@@ -1,10 +1,13 @@
 import time
-import tempfile
 from typing import Callable, List, Optional
 
 import numpy as np
 import sounddevice as sd
-from scipy.io.wavfile import write
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Falls back to the NumPy energy helper below
 
 from app.config import (
     CHUNK_DURATION,
@@ -13,12 +16,34 @@ from app.config import (
     SAMPLE_RATE,
     SILENCE_DURATION,
     SILENCE_THRESHOLD,
+    SILENCE_THRESHOLD_SQ,
 )
 
 
 StatusFn = Callable[[str], None]
 
 
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _block_energy_sq(flat):
+        """Mean-square energy of one audio block, compiled to native code."""
+        s = 0.0
+        for i in range(flat.size):
+            s += flat[i] * flat[i]
+        return s / flat.size
+
+    # Warm up once at import so JIT compilation never runs on the
+    # real-time audio thread.
+    _block_energy_sq(np.zeros(8, dtype=np.float32))
+
+else:
+
+    def _block_energy_sq(flat):
+        """Mean-square energy of one audio block (NumPy fallback)."""
+        return float(np.dot(flat, flat)) / flat.size
+
+
 def list_audio_devices() -> List[dict]:
     """Return available audio devices."""
     return sd.query_devices()
@@ -39,22 +64,44 @@ def record_until_silence(
     min_record_time: float = MIN_RECORD_TIME,
     max_record_time: float = MAX_RECORD_TIME,
     status_cb: Optional[StatusFn] = None,
-) -> Optional[str]:
-    """Stream from mic until silence or timeout and return wav path."""
-    audio_frames = []
+) -> Optional[np.ndarray]:
+    """Stream from mic until silence or timeout.
+
+    Returns the capture as float32 mono samples at SAMPLE_RATE, peak
+    normalized to [-1, 1] — exactly what the STT model consumes — or
+    None if nothing was recorded. The audio never touches disk; the old
+    WAV-tempfile handoff cost a write plus a decode every turn.
+    """
+    blocksize = int(SAMPLE_RATE * CHUNK_DURATION)
+    # Preallocate the whole capture buffer (bounded by max_record_time) so
+    # the callback copies blocks in place instead of growing a list of
+    # small arrays that must be concatenated afterwards.
+    buf = np.empty(int(max_record_time * SAMPLE_RATE) + blocksize, dtype=np.float32)
+    write_ptr = 0
     silent_time = 0.0
+    # Compare mean-square energy against the squared threshold; use the
+    # precomputed config constant unless the caller overrode the default.
+    if silence_threshold is SILENCE_THRESHOLD:
+        silence_threshold_sq = SILENCE_THRESHOLD_SQ
+    else:
+        silence_threshold_sq = silence_threshold * silence_threshold
 
     def _say(msg: str) -> None:
         if status_cb:
             status_cb(msg)
 
     def callback(indata, frames, time_info, status):
-        nonlocal silent_time
+        nonlocal silent_time, write_ptr
 
-        energy = float(np.mean(np.abs(indata)))
-        audio_frames.append(indata.copy())
+        flat = indata.reshape(-1)
+        energy_sq = float(_block_energy_sq(flat))
 
-        if energy < silence_threshold:
+        n = min(flat.size, buf.size - write_ptr)
+        if n > 0:
+            buf[write_ptr:write_ptr + n] = flat[:n]
+            write_ptr += n
+
+        if energy_sq < silence_threshold_sq:
             silent_time += frames / SAMPLE_RATE
         else:
             silent_time = 0.0
@@ -64,7 +111,7 @@ def record_until_silence(
         channels=1,
         dtype="float32",
         callback=callback,
-        blocksize=int(SAMPLE_RATE * CHUNK_DURATION),
+        blocksize=blocksize,
     ):
         start_time = time.time()
         while True:
@@ -79,14 +126,14 @@ def record_until_silence(
                 _say("Silence detected, stopping")
                 break
 
-    if not audio_frames:
+    if write_ptr == 0:
         return None
 
-    audio = np.concatenate(audio_frames, axis=0).flatten()
+    audio = buf[:write_ptr]
     max_val = float(np.max(np.abs(audio))) if audio.size else 0.0
-    audio_out = np.int16(audio / max_val * 32767) if max_val > 0 else np.int16(audio)
-
-    temp_wav = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-    write(temp_wav.name, SAMPLE_RATE, audio_out)
-    return temp_wav.name
+    if max_val > 0:
+        # In-place float32 peak normalization: no float64 upcast, no
+        # extra allocation. Mutating audio is safe; the caller owns it.
+        np.multiply(audio, np.float32(1.0 / max_val), out=audio)
+    return audio
 
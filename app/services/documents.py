@@ -1,19 +1,13 @@
 """Document readiness checking for welfare schemes."""
 
-import json
-import os
 from typing import Any, Dict, List, Optional
 
+from app.services._schemes_cache import get_scheme_by_id, get_schemes
+
 
 def load_schemes() -> List[Dict[str, Any]]:
-    """Load schemes from schemes.json file."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    app_dir = os.path.dirname(current_dir)
-    schemes_path = os.path.join(app_dir, "schemes.json")
-    
-    with open(schemes_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("schemes", [])
+    """Load schemes from schemes.json (cached, parsed once per process)."""
+    return get_schemes()
 
 
 def get_required_documents(scheme_id: str) -> List[str]:
@@ -26,11 +20,10 @@ def get_required_documents(scheme_id: str) -> List[str]:
     Returns:
         List of document names (e.g., ["aadhaar", "ration_card", ...])
     """
-    schemes = load_schemes()
-    for scheme in schemes:
-        if scheme.get("scheme_id") == scheme_id:
-            return scheme.get("required_documents", [])
-    return []
+    scheme = get_scheme_by_id(scheme_id)
+    if scheme is None:
+        return []
+    return scheme.get("required_documents", [])
 
 
 def initialize_document_state(scheme_id: str) -> Dict[str, str]:
@@ -63,6 +56,54 @@ def get_next_unknown_document(documents: Dict[str, str]) -> Optional[str]:
     return None
 
 
+def apply_document_answer(
+    documents: Dict[str, str], document: str, answer: str
+) -> Dict[str, str]:
+    """
+    Record the user's answer for one document and return the new status.
+
+    Equivalent to setting documents[document] = answer and calling
+    check_document_readiness again, but incremental: the document being
+    answered is always the first unknown one, so any remaining unknown
+    must come after it in insertion order and only that suffix is
+    scanned. The full dict is walked only once the last unknown is
+    resolved, to collect the missing documents.
+
+    Args:
+        documents: Document state dict (mutated in place)
+        document: Document the user just answered about
+        answer: "yes" or "no"
+
+    Returns:
+        Same shape as check_document_readiness.
+    """
+    documents[document] = answer
+
+    past_answered = False
+    for doc, status in documents.items():
+        if not past_answered:
+            past_answered = doc == document
+        elif status == "unknown":
+            return {
+                "status": "checking",
+                "missing_docs": [],
+                "next_doc": doc,
+            }
+
+    missing_docs = [doc for doc, status in documents.items() if status == "no"]
+    if missing_docs:
+        return {
+            "status": "missing",
+            "missing_docs": missing_docs,
+            "next_doc": None,
+        }
+    return {
+        "status": "ready",
+        "missing_docs": [],
+        "next_doc": None,
+    }
+
+
 def check_document_readiness(documents: Dict[str, str]) -> Dict[str, str]:
     """
     Check document readiness status.
@@ -73,14 +114,21 @@ def check_document_readiness(documents: Dict[str, str]) -> Dict[str, str]:
         - "missing_docs": List of documents with status "no"
         - "next_doc": Next document to ask about (if status is "checking")
     """
-    unknown_docs = [doc for doc, status in documents.items() if status == "unknown"]
-    missing_docs = [doc for doc, status in documents.items() if status == "no"]
-    
-    if unknown_docs:
+    # Single pass: track the first unknown document and collect missing ones.
+    first_unknown: Optional[str] = None
+    missing_docs: List[str] = []
+    for doc, status in documents.items():
+        if status == "unknown":
+            if first_unknown is None:
+                first_unknown = doc
+        elif status == "no":
+            missing_docs.append(doc)
+
+    if first_unknown is not None:
         return {
             "status": "checking",
             "missing_docs": [],
-            "next_doc": unknown_docs[0],
+            "next_doc": first_unknown,
         }
     elif missing_docs:
         return {
@@ -4,21 +4,16 @@ This module evaluates eligibility rules and returns matching schemes.
 No memory, no planner, no voice - pure evaluation only.
 """
 
-import json
-import os
-from typing import Any, Dict, List, Optional
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.services._schemes_cache import get_schemes
 
 
 def load_schemes() -> List[Dict[str, Any]]:
-    """Load schemes from schemes.json file."""
-    # Get path to schemes.json (in app/ directory, one level up from services/)
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    app_dir = os.path.dirname(current_dir)
-    schemes_path = os.path.join(app_dir, "schemes.json")
-    
-    with open(schemes_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get("schemes", [])
+    """Load schemes from schemes.json (cached, parsed once per process)."""
+    return get_schemes()
 
 
 def evaluate_rule(rule: Dict[str, Any], slots: Dict[str, Any]) -> bool:
@@ -68,31 +63,89 @@ def evaluate_rule(rule: Dict[str, Any], slots: Dict[str, Any]) -> bool:
         return False
 
 
+_OPERATORS = {"==": operator.eq, ">=": operator.ge, "<=": operator.le}
+
+
+def _compile_rule(rule: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile a rule dict into a predicate over the slots dict.
+
+    Operator dispatch, field lookup, and value unpacking happen once per
+    rule at compile time; evaluating a scheme is then just calling the
+    stored closures, with no per-turn string comparisons.
+    """
+    field = rule.get("field")
+    expected_value = rule.get("value")
+    op = _OPERATORS.get(rule.get("operator"))
+
+    if op is not None:
+        def predicate(slots, _field=field, _op=op, _expected=expected_value):
+            actual = slots.get(_field)
+            return actual is not None and _op(actual, _expected)
+
+        return predicate
+
+    if (
+        rule.get("operator") == "between"
+        and isinstance(expected_value, list)
+        and len(expected_value) == 2
+    ):
+        min_val, max_val = expected_value
+
+        def predicate(slots, _field=field, _min=min_val, _max=max_val):
+            actual = slots.get(_field)
+            return actual is not None and _min <= actual <= _max
+
+        return predicate
+
+    # Unknown/malformed operator - fail safely, as evaluate_rule does.
+    return lambda slots: False
+
+
+def _compiled_rules(scheme: Dict[str, Any]) -> List[Callable[[Dict[str, Any]], bool]]:
+    """Compiled predicates for a scheme, built on first use and cached."""
+    compiled = scheme.get("_compiled_rules")
+    if compiled is None:
+        rules = scheme.get("eligibility", {}).get("rules", [])
+        compiled = scheme["_compiled_rules"] = [_compile_rule(r) for r in rules]
+    return compiled
+
+
 def check_scheme_eligibility(
-    scheme: Dict[str, Any], slots: Dict[str, Any]
+    scheme: Dict[str, Any],
+    slots: Dict[str, Any],
+    available_fields: Optional[frozenset] = None,
 ) -> Optional[Dict[str, str]]:
     """
     Check if a scheme is eligible based on slots.
-    
+
+    Args:
+        scheme: Scheme dict from the cached catalog.
+        slots: Slot values to evaluate.
+        available_fields: Optional precomputed set of slot names with
+            non-None values, so batch callers pay the scan once.
+
     Returns:
         Dict with scheme_id and reason_ta if eligible, None otherwise.
     """
     eligibility = scheme.get("eligibility", {})
-    required_fields = eligibility.get("required_fields", [])
-    rules = eligibility.get("rules", [])
-    
+
     # Check if all required fields are present and not None
-    for field in required_fields:
-        if field not in slots or slots[field] is None:
-            # Missing required field - do not evaluate this scheme
-            return None
-    
-    # Evaluate all rules (AND logic - all must pass)
-    for rule in rules:
-        if not evaluate_rule(rule, slots):
+    if available_fields is None:
+        available_fields = frozenset(k for k, v in slots.items() if v is not None)
+    required_set = scheme.get("_required_fields_set")
+    if required_set is None:
+        required_set = frozenset(eligibility.get("required_fields", []))
+    if not required_set.issubset(available_fields):
+        # Missing required field - do not evaluate this scheme
+        return None
+
+    # Evaluate all compiled rules (AND logic - all must pass)
+    for predicate in _compiled_rules(scheme):
+        if not predicate(slots):
             # Rule failed - not eligible
             return None
-    
+
     # All rules passed - eligible
     return {
         "scheme_id": scheme["scheme_id"],
@@ -100,25 +153,41 @@ def check_scheme_eligibility(
     }
 
 
+@lru_cache(maxsize=256)
+def _check_eligibility_cached(slots_key: frozenset) -> Tuple[Tuple[str, str], ...]:
+    """Rule evaluation memoized on the canonical (slot, value) set."""
+    slots = dict(slots_key)
+    schemes = load_schemes()
+    eligible = []
+
+    # Scan the slots once; each scheme then prefilters with one set op.
+    available_fields = frozenset(k for k, v in slots.items() if v is not None)
+
+    for scheme in schemes:
+        result = check_scheme_eligibility(scheme, slots, available_fields)
+        if result:
+            eligible.append((result["scheme_id"], result["reason_ta"]))
+
+    return tuple(eligible)
+
+
 def check_eligibility(slots: Dict[str, Any]) -> List[Dict[str, str]]:
     """
     Main eligibility engine function.
-    
+
     Input:
         slots: Dict of slot_name -> value (e.g., {"age": 65, "bpl_status": True})
-    
+
     Output:
         List of eligible schemes, each with scheme_id and reason_ta.
         Empty list if no schemes match.
- 
+
+    Repeat calls with an unchanged profile (common across multi-turn
+    sessions) hit an lru_cache instead of re-evaluating every rule.
     """
-    schemes = load_schemes()
-    eligible = []
-    
-    for scheme in schemes:
-        result = check_scheme_eligibility(scheme, slots)
-        if result:
-            eligible.append(result)
-    
-    return eligible
+    slots_key = frozenset(slots.items())
+    return [
+        {"scheme_id": scheme_id, "reason_ta": reason_ta}
+        for scheme_id, reason_ta in _check_eligibility_cached(slots_key)
+    ]
 
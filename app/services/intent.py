@@ -58,11 +58,17 @@ Tamil input:
 """
 
 
+# Compiled once at import; extract_json_from_text runs on every LLM reply.
+_JSON_FENCE_OPEN = re.compile(r"```json\s*\n?")
+_JSON_FENCE_CLOSE = re.compile(r"```\s*\n?")
+_JSON_BODY = re.compile(r"\{.*\}", re.DOTALL)
+
+
 def extract_json_from_text(text: str) -> str:
     """Extract JSON from text that might be wrapped in markdown code blocks."""
-    text = re.sub(r"```json\s*\n?", "", text)
-    text = re.sub(r"```\s*\n?", "", text)
-    json_match = re.search(r"\{.*\}", text, re.DOTALL)
+    text = _JSON_FENCE_OPEN.sub("", text)
+    text = _JSON_FENCE_CLOSE.sub("", text)
+    json_match = _JSON_BODY.search(text)
     if json_match:
         return json_match.group(0)
     return text.strip()
@@ -116,8 +122,12 @@ def extract_intent_and_slots(text: str, llm_call_fn: Optional[Callable[[str, flo
     raw_output = llm_call_fn(prompt=prompt, temperature=0.0)
 
     try:
-        json_text = extract_json_from_text(raw_output)
-        parsed = json.loads(json_text)
+        # Common case: Gemini returns bare JSON; skip the regex extraction.
+        try:
+            parsed = json.loads(raw_output)
+        except json.JSONDecodeError:
+            json_text = extract_json_from_text(raw_output)
+            parsed = json.loads(json_text)
     except (json.JSONDecodeError, AttributeError):
         parsed = {
             "intent": "FIND_ELIGIBLE_SCHEME",
@@ -3,57 +3,54 @@
 import re
 from typing import Optional
 
+# Tamil yes patterns (including partial/misrecognized forms)
+_YES_PATTERNS = [
+    r"ஆம்",
+    r"அம்",  # Partial/misrecognized "ஆம்"
+    r"உண்டு",
+    r"இருக்கிறது",
+    r"இருக்கும்",
+    r"வேண்டும்",
+    r"சரி",
+    r"ஆகும்",
+    r"உள்ளது",
+    r"உள்ள",  # Partial
+]
+
+# Tamil no patterns
+_NO_PATTERNS = [
+    r"இல்லை",
+    r"இல்லாது",
+    r"இல்ல",
+    r"வேண்டாம்",
+    r"சரியில்லை",
+]
+
+# Compiled once at import: one alternation per polarity, Tamil and
+# English merged, so a call is at most two linear scans. English words
+# keep their \b guards; Tamil patterns are substring matches as before.
+_YES_RE = re.compile(
+    "|".join(_YES_PATTERNS) + r"|\b(?:yes|yeah|yep|y|ok|okay|sure)\b"
+)
+_NO_RE = re.compile("|".join(_NO_PATTERNS) + r"|\b(?:no|nope|nah|n)\b")
+
 
 def extract_yes_no_from_tamil(text: str) -> Optional[str]:
     """
     Extract yes/no response from Tamil text.
-    
+
     Args:
         text: Tamil text input
-        
+
     Returns:
         "yes", "no", or None if unclear
     """
     text_lower = text.lower().strip()
-    
-    # Tamil yes patterns (including partial/misrecognized forms)
-    yes_patterns = [
-        r"ஆம்",
-        r"அம்",  # Partial/misrecognized "ஆம்"
-        r"உண்டு",
-        r"இருக்கிறது",
-        r"இருக்கும்",
-        r"வேண்டும்",
-        r"சரி",
-        r"ஆகும்",
-        r"உள்ளது",
-        r"உள்ள",  # Partial
-    ]
-    
-    # Tamil no patterns
-    no_patterns = [
-        r"இல்லை",
-        r"இல்லாது",
-        r"இல்ல",
-        r"வேண்டாம்",
-        r"சரியில்லை",
-    ]
-    
-    # Check for yes
-    for pattern in yes_patterns:
-        if re.search(pattern, text_lower):
-            return "yes"
-    
-    # Check for no
-    for pattern in no_patterns:
-        if re.search(pattern, text_lower):
-            return "no"
-    
-    # Check for English yes/no (fallback)
-    if re.search(r"\b(yes|yeah|yep|y|ok|okay|sure)\b", text_lower):
+
+    if _YES_RE.search(text_lower):
         return "yes"
-    if re.search(r"\b(no|nope|nah|n)\b", text_lower):
+
+    if _NO_RE.search(text_lower):
         return "no"
-    
-    return None
 
+    return None
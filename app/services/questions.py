@@ -4,7 +4,11 @@ This module uses LLM ONLY for Tamil phrasing, not for decision-making.
 The planner decides what to ask; this module phrases it in Tamil.
 """
 
+import json
 import os
+import re
+import threading
+import time
 from typing import Optional
 
 try:
@@ -12,6 +16,15 @@ try:
 except ImportError:
     genai = None  # Will use fallback questions if LLM not available
 
+try:
+    import orjson
+
+    def _json_loads(text):
+        return orjson.loads(text)
+
+except ImportError:
+    _json_loads = json.loads  # stdlib fallback
+
 
 # Slot to question type mapping (locked)
 SLOT_QUESTION_TYPES = {
@@ -24,47 +37,86 @@ SLOT_QUESTION_TYPES = {
     "gender": "Male/Female",
 }
 
+# Static Tamil phrasing tables, built once at import instead of per call.
+_SLOT_QUESTIONS = {
+    "age": "உங்கள் வயது என்ன?",
+    "bpl_status": "நீங்கள் BPL / ஏழை பட்டியலில் உள்ளவரா?",
+    "is_landholding_farmer": "நீங்கள் நிலம் வைத்திருக்கும் விவசாயியா?",
+    "not_excluded_category": "நீங்கள் விலக்கப்பட்ட வகையில் இல்லையா?",
+    "is_pregnant_or_lactating": "நீங்கள் கர்ப்பிணியா அல்லது தாய்ப்பால் கொடுப்பவரா?",
+    "meets_any_social_category": "நீங்கள் சமூக பிரிவில் உள்ளவரா?",
+    "gender": "உங்கள் பாலினம் என்ன?",
+}
+_SLOT_FALLBACK_TEMPLATE = "தயவுசெய்து {slot} பற்றி தகவல் கொடுங்கள்."
+
+_DOC_QUESTIONS = {
+    "aadhaar": "உங்களிடம் ஆதார் இருக்கிறதா?",
+    "ration_card": "உங்களிடம் ரேஷன் கார்டு இருக்கிறதா?",
+    "bank_passbook": "உங்களிடம் வங்கி பாஸ்புக் இருக்கிறதா?",
+    "age_proof": "உங்களிடம் வயது சான்றிதழ் இருக்கிறதா?",
+    "land_document": "உங்களிடம் நிலம் சான்றிதழ் இருக்கிறதா?",
+    "maternity_card": "உங்களிடம் மகப்பேறு கார்டு இருக்கிறதா?",
+}
+_DOC_FALLBACK_TEMPLATE = "உங்களிடம் {document} இருக்கிறதா?"
+
+_DOC_NAMES_TA = {
+    "aadhaar": "ஆதார்",
+    "ration_card": "ரேஷன் கார்டு",
+    "bank_passbook": "வங்கி பாஸ்புக்",
+    "age_proof": "வயது சான்றிதழ்",
+    "land_document": "நிலம் சான்றிதழ்",
+    "maternity_card": "மகப்பேறு கார்டு",
+}
+
+# bool is hashable and singleton, so a dict lookup replaces the
+# is True / is False chain.
+_TAMIL_BOOL = {True: "ஆம்", False: "இல்லை"}
+
+_SLOT_NAMES_TA = {
+    "is_landholding_farmer": "விவசாயி",
+    "bpl_status": "BPL பட்டியல்",
+    "age": "வயது",
+    "gender": "பாலினம்",
+    "not_excluded_category": "விலக்கப்பட்ட வகை",
+    "is_pregnant_or_lactating": "கர்ப்பிணி அல்லது தாய்ப்பால்",
+    "meets_any_social_category": "சமூக பிரிவு",
+}
+
+
+# Built once and reused: creating a genai.Client rebuilds the HTTP
+# session and TLS state, ~20-50ms per call otherwise.
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
 
 def get_llm_client():
     """
-    Get Gemini LLM client.
-    
+    Get the shared Gemini LLM client (created once per process).
+
     Reads API key from GOOGLE_API_KEY environment variable.
     Set it from terminal:
         Windows: set GOOGLE_API_KEY=YOUR_KEY
         Linux/Mac: export GOOGLE_API_KEY=YOUR_KEY
-    
+
     Returns:
         genai.Client if API key is available, None otherwise
     """
+    global _CLIENT
     if genai is None:
         return None  # Will trigger fallback in calling functions
+    if _CLIENT is not None:
+        return _CLIENT
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         return None
-    try:
-        return genai.Client(api_key=api_key)
-    except Exception as e:
-        # If client creation fails, return None to trigger fallback
-        return None
-
-
-CONTRADICTION_PROMPT = """You are a Tamil language assistant helping resolve contradictions in user information.
-
-Task: Generate a polite Tamil message asking the user to clarify a contradiction.
-
-Rules:
-- Output ONLY the Tamil message text
-- Do NOT add explanations
-- Do NOT add English translations
-- Keep it respectful and helpful
-- Use respectful Tamil (நீங்கள் form)
-
-Previous value: {previous_value}
-New value: {new_value}
-Slot name: {slot}
-
-Generate the Tamil clarification request:"""
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            try:
+                _CLIENT = genai.Client(api_key=api_key)
+            except Exception:
+                # If client creation fails, return None to trigger fallback
+                return None
+    return _CLIENT
 
 
 def ask_for_slot(slot: str) -> str:
@@ -82,79 +134,140 @@ def ask_for_slot(slot: str) -> str:
         The planner decides which slot to ask for.
     """
     # Use default questions directly (no LLM call)
-    default_questions = {
-        "age": "உங்கள் வயது என்ன?",
-        "bpl_status": "நீங்கள் BPL / ஏழை பட்டியலில் உள்ளவரா?",
-        "is_landholding_farmer": "நீங்கள் நிலம் வைத்திருக்கும் விவசாயியா?",
-        "not_excluded_category": "நீங்கள் விலக்கப்பட்ட வகையில் இல்லையா?",
-        "is_pregnant_or_lactating": "நீங்கள் கர்ப்பிணியா அல்லது தாய்ப்பால் கொடுப்பவரா?",
-        "meets_any_social_category": "நீங்கள் சமூக பிரிவில் உள்ளவரா?",
-        "gender": "உங்கள் பாலினம் என்ன?",
-    }
-    return default_questions.get(slot, f"தயவுசெய்து {slot} பற்றி தகவல் கொடுங்கள்.")
+    question = _SLOT_QUESTIONS.get(slot)
+    if question is None:
+        question = _SLOT_FALLBACK_TEMPLATE.format(slot=slot)
+    return question
+
+
+# LLM-refined contradiction messages keyed by (slot, prev_ta, new_ta),
+# filled in by background refinement threads.
+_CONTRADICTION_CACHE = {}
+
+
+def _value_to_tamil(val) -> str:
+    """Convert a slot value to readable Tamil."""
+    if isinstance(val, bool):
+        return _TAMIL_BOOL[val]
+    if isinstance(val, str):
+        return val
+    return str(val)
+
+
+def _template_contradiction(slot: str, prev_ta: str, new_ta: str) -> str:
+    """Deterministic Tamil contradiction message (no LLM call)."""
+    slot_ta = _SLOT_NAMES_TA.get(slot, slot)
+    return f"முன்னர் நீங்கள் {slot_ta} பற்றி '{prev_ta}' என்று சொன்னீர்கள், இப்போது '{new_ta}' என்கிறீர்கள். எது சரி?"
+
+
+# Constant instruction block, passed as system_instruction so Gemini's
+# implicit prompt caching can reuse the prefix across calls; only the
+# small per-call items JSON goes in the user content.
+CONTRADICTION_SYSTEM_INSTRUCTION = """You are a Tamil language assistant helping resolve contradictions in user information.
+
+Task: For EACH item the user sends, generate a polite Tamil message asking the user to clarify the contradiction.
+
+Rules:
+- Output ONLY valid JSON: an object mapping each item's "id" to its Tamil message
+- Do NOT add explanations
+- Do NOT add English translations
+- Keep each message respectful and helpful
+- Use respectful Tamil (நீங்கள் form)"""
+
+# Refinement requests queued for the next batched LLM call. Batching
+# amortizes the shared instruction prompt and keeps the request rate
+# under Gemini's per-minute limits.
+_PENDING = []
+_PENDING_LOCK = threading.Lock()
+_BATCH_MAX = 8
+_BATCH_WINDOW_S = 0.05
+
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _enqueue_refinement(key) -> None:
+    """Queue a contradiction key for batched refinement."""
+    with _PENDING_LOCK:
+        if key in _PENDING:
+            return
+        _PENDING.append(key)
+        start_worker = len(_PENDING) == 1
+    if start_worker:
+        threading.Thread(target=_refine_pending, daemon=True).start()
+
+
+def _refine_pending() -> None:
+    """Drain queued keys and refine them with one batched Gemini call."""
+    while True:
+        time.sleep(_BATCH_WINDOW_S)
+        with _PENDING_LOCK:
+            batch = _PENDING[:_BATCH_MAX]
+            del _PENDING[: len(batch)]
+        if not batch:
+            return
+        try:
+            client = get_llm_client()
+            if client is None:
+                return
+            items = [
+                {"id": str(i), "slot": slot, "previous_value": prev, "new_value": new}
+                for i, (slot, prev, new) in enumerate(batch)
+            ]
+            response = client.models.generate_content(
+                model="models/gemini-2.5-flash",
+                contents=json.dumps(items, ensure_ascii=False),
+                config={
+                    "temperature": 0.3,
+                    "system_instruction": CONTRADICTION_SYSTEM_INSTRUCTION,
+                    # Constrained decoding: the model must emit JSON, so
+                    # no preamble stripping is needed on the happy path.
+                    "response_mime_type": "application/json",
+                },
+            )
+            try:
+                parsed = _json_loads(response.text)
+            except ValueError:
+                match = _JSON_OBJECT_RE.search(response.text)
+                parsed = _json_loads(match.group(0)) if match else {}
+            for i, key in enumerate(batch):
+                message = parsed.get(str(i))
+                if isinstance(message, str) and message.strip():
+                    _CONTRADICTION_CACHE[key] = message.strip()
+        except Exception:
+            # Refinement is best effort; the template already shipped.
+            pass
 
 
 def handle_contradiction(slot: str, previous_value: any, new_value: any) -> str:
     """
     Generate a Tamil message to handle a contradiction.
-    
+
     Args:
         slot: Slot name that has contradiction
         previous_value: Previously stored value
         new_value: New value that contradicts
-    
+
     Returns:
         Tamil clarification request string
-    
+
     Example:
         "முன்னர் நீங்கள் விவசாயி என்று சொன்னீர்கள், இப்போது இல்லை என்கிறீர்கள். எது சரி?"
-    
+
     Note:
-        Uses LLM for natural Tamil phrasing of contradiction messages.
+        Returns immediately from a deterministic template (or a cached
+        LLM phrasing from an earlier turn); LLM refinement runs on a
+        background thread so the network round-trip never blocks the
+        user-facing response.
     """
-    # Convert values to readable Tamil
-    def value_to_tamil(val):
-        if val is True:
-            return "ஆம்"
-        elif val is False:
-            return "இல்லை"
-        elif isinstance(val, str):
-            return val
-        else:
-            return str(val)
-    
-    prev_ta = value_to_tamil(previous_value)
-    new_ta = value_to_tamil(new_value)
-    
-    prompt = CONTRADICTION_PROMPT.format(
-        slot=slot,
-        previous_value=prev_ta,
-        new_value=new_ta
-    )
-    
-    try:
-        client = get_llm_client()
-        if client is None:
-            raise ImportError("LLM not available")
-        response = client.models.generate_content(
-            model="models/gemini-2.5-flash",
-            contents=prompt,
-            config={"temperature": 0.3}
-        )
-        return response.text.strip()
-    except Exception as e:
-        # Fallback to simple Tamil contradiction message
-        slot_names_ta = {
-            "is_landholding_farmer": "விவசாயி",
-            "bpl_status": "BPL பட்டியல்",
-            "age": "வயது",
-            "gender": "பாலினம்",
-            "not_excluded_category": "விலக்கப்பட்ட வகை",
-            "is_pregnant_or_lactating": "கர்ப்பிணி அல்லது தாய்ப்பால்",
-            "meets_any_social_category": "சமூக பிரிவு",
-        }
-        slot_ta = slot_names_ta.get(slot, slot)
-        return f"முன்னர் நீங்கள் {slot_ta} பற்றி '{prev_ta}' என்று சொன்னீர்கள், இப்போது '{new_ta}' என்கிறீர்கள். எது சரி?"
+    prev_ta = _value_to_tamil(previous_value)
+    new_ta = _value_to_tamil(new_value)
+
+    cached = _CONTRADICTION_CACHE.get((slot, prev_ta, new_ta))
+    if cached is not None:
+        return cached
+
+    _enqueue_refinement((slot, prev_ta, new_ta))
+    return _template_contradiction(slot, prev_ta, new_ta)
 
 
 def ask_for_document(document: str) -> str:
@@ -171,15 +284,10 @@ def ask_for_document(document: str) -> str:
         Uses default questions to avoid LLM calls (Gemini resource limits).
     """
     # Use default questions directly (no LLM call)
-    default_questions = {
-        "aadhaar": "உங்களிடம் ஆதார் இருக்கிறதா?",
-        "ration_card": "உங்களிடம் ரேஷன் கார்டு இருக்கிறதா?",
-        "bank_passbook": "உங்களிடம் வங்கி பாஸ்புக் இருக்கிறதா?",
-        "age_proof": "உங்களிடம் வயது சான்றிதழ் இருக்கிறதா?",
-        "land_document": "உங்களிடம் நிலம் சான்றிதழ் இருக்கிறதா?",
-        "maternity_card": "உங்களிடம் மகப்பேறு கார்டு இருக்கிறதா?",
-    }
-    return default_questions.get(document, f"உங்களிடம் {document} இருக்கிறதா?")
+    question = _DOC_QUESTIONS.get(document)
+    if question is None:
+        question = _DOC_FALLBACK_TEMPLATE.format(document=document)
+    return question
 
 
 def confirm_application(scheme_name_ta: str) -> str:
@@ -214,15 +322,7 @@ def explain_missing_document(document: str, scheme_name_ta: str) -> str:
         Uses default messages to avoid LLM calls (Gemini resource limits).
     """
     # Use default messages directly (no LLM call)
-    doc_names_ta = {
-        "aadhaar": "ஆதார்",
-        "ration_card": "ரேஷன் கார்டு",
-        "bank_passbook": "வங்கி பாஸ்புக்",
-        "age_proof": "வயது சான்றிதழ்",
-        "land_document": "நிலம் சான்றிதழ்",
-        "maternity_card": "மகப்பேறு கார்டு",
-    }
-    doc_ta = doc_names_ta.get(document, document)
+    doc_ta = _DOC_NAMES_TA.get(document, document)
     return f"இந்த திட்டத்திற்கு {doc_ta} அவசியம். அது கிடைத்த பிறகு விண்ணப்பிக்கலாம்."
 
 
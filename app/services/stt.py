@@ -1,39 +1,217 @@
-import functools
-import whisper
+import os
+import threading
+from dataclasses import dataclass
+from typing import List, Union
 
-from app.config import LANG_TAMIL
+import ctranslate2
+import numpy as np
+from faster_whisper import WhisperModel
+from scipy.io import wavfile
+from scipy.signal import resample_poly
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None  # Older faster-whisper; sequential fallback
 
-@functools.lru_cache(maxsize=1)
-def load_model(model_size: str = "small"):
-    """Lazy-load Whisper model once per process."""
-    return whisper.load_model(model_size)
+from app.config import LANG_TAMIL, SAMPLE_RATE
 
+# Loaded models kept as module globals; one entry per model size. The
+# lock makes first-use lazy loading safe when concurrent Streamlit
+# session threads race on a cold process.
+_MODELS = {}
+_BATCHED_PIPELINES = {}
+_MODELS_LOCK = threading.Lock()
 
-def speech_to_text(audio_path: str, model_size: str = "small") -> tuple[str, float]:
+
+@dataclass(slots=True, frozen=True)
+class STTResult:
+    """Transcription output; attribute access instead of tuple unpacking."""
+
+    text: str
+    confidence: float
+
+
+def _detect_device() -> tuple[str, str]:
+    """Pick (device, compute_type): FP16 on CUDA, INT8 on CPU."""
+    try:
+        if ctranslate2.get_cuda_device_count() > 0:
+            return "cuda", "float16"
+    except Exception:
+        pass
+    return "cpu", "int8"
+
+
+def load_model(model_size: str = "small") -> WhisperModel:
+    """Load the CTranslate2 Whisper model once per process.
+
+    On CUDA hosts the model runs in FP16 (half the memory bandwidth of
+    FP32, Tensor Core GEMMs); on CPU it runs INT8, which uses the int8
+    GEMM paths and is typically 2-4x faster than reference FP32 for the
+    same model size.
     """
-    Convert Tamil speech to text.
-    
-    Returns:
-        (text, confidence): Tuple of recognized text and confidence score (0.0-1.0)
+    model = _MODELS.get(model_size)
+    if model is None:
+        with _MODELS_LOCK:
+            model = _MODELS.get(model_size)
+            if model is None:
+                device, compute_type = _detect_device()
+                model = _MODELS[model_size] = WhisperModel(
+                    model_size,
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=os.cpu_count() or 4,
+                )
+    return model
+
+
+def warmup(model_size: str = "small") -> None:
+    """
+    Eagerly load the model and transcribe one second of silence.
+
+    Run this at app startup so the model load and the first inference
+    happen off the first user request.
     """
     model = load_model(model_size)
-    result = model.transcribe(audio_path, language=LANG_TAMIL, fp16=False)
-    text = result["text"].strip()
-    
-    # Calculate confidence from Whisper's average log probability
-    # Whisper returns segments with avg_logprob, convert to confidence (0-1)
-    segments = result.get("segments", [])
-    if segments:
-        # Average log probability across all segments
-        avg_logprob = sum(seg.get("avg_logprob", -1.0) for seg in segments) / len(segments)
-        # Convert log probability to confidence (rough heuristic)
-        # logprob typically ranges from -1.0 (low) to 0.0 (high)
-        # Map to 0.0-1.0: confidence = (logprob + 1.0) / 1.0, clamped
-        confidence = max(0.0, min(1.0, (avg_logprob + 1.0)))
+    segments, _ = model.transcribe(
+        np.zeros(SAMPLE_RATE, dtype=np.float32), language=LANG_TAMIL
+    )
+    # Transcription is lazy; drain the iterator to actually run it.
+    for _segment in segments:
+        pass
+
+
+def _load_audio(path: str) -> np.ndarray:
+    """
+    Decode a WAV file to float32 mono @ 16 kHz in-process.
+
+    Passing a file path to transcribe() would make the backend spawn an
+    ffmpeg subprocess per call; decoding with scipy hands the model a
+    ready ndarray instead.
+    """
+    sample_rate, data = wavfile.read(path)
+    if data.dtype == np.int16:
+        audio = data.astype(np.float32) / 32768.0
+    elif data.dtype == np.int32:
+        audio = data.astype(np.float32) / 2147483648.0
+    else:
+        audio = data.astype(np.float32)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if sample_rate != SAMPLE_RATE:
+        audio = resample_poly(audio, SAMPLE_RATE, sample_rate).astype(np.float32)
+    return audio
+
+
+def _result_from_segments(segments) -> STTResult:
+    """Drain a lazy segment iterator into text plus a confidence score."""
+    # Single pass over the lazy segment iterator: collect text, log
+    # probabilities, and durations together.
+    texts = []
+    logprobs = []
+    durations = []
+    for segment in segments:
+        texts.append(segment.text)
+        logprobs.append(segment.avg_logprob)
+        durations.append(segment.end - segment.start)
+
+    text = "".join(texts).strip()
+
+    if logprobs:
+        logprob_arr = np.asarray(logprobs, dtype=np.float32)
+        weights = np.asarray(durations, dtype=np.float32)
+        # Weight by segment duration so a short garbled segment doesn't
+        # dominate the score of a long clean utterance.
+        if weights.sum() > 0:
+            avg_logprob = float(np.average(logprob_arr, weights=weights))
+        else:
+            avg_logprob = float(logprob_arr.mean())
+        # Sigmoid centered at logprob -0.5: the old linear clamp
+        # (logprob + 1.0) reported 0.5 confidence at -0.5, where the
+        # model is empirically much more reliable than a coin flip.
+        confidence = float(1.0 / (1.0 + np.exp(-5.0 * (avg_logprob + 0.5))))
     else:
         # Fallback: if no segments, use text length as heuristic
         confidence = 0.7 if len(text) > 5 else 0.3
-    
-    return text, confidence
 
+    return STTResult(text, confidence)
+
+
+def speech_to_text(
+    audio_input: Union[str, np.ndarray], model_size: str = "small"
+) -> STTResult:
+    """
+    Convert Tamil speech to text.
+
+    Args:
+        audio_input: WAV file path, or float32 mono samples @ 16 kHz.
+
+    Returns:
+        STTResult with recognized text and confidence score (0.0-1.0)
+    """
+    if isinstance(audio_input, str):
+        audio_input = _load_audio(audio_input)
+
+    model = load_model(model_size)
+    # VAD drops leading/trailing silence and long pauses before decoding;
+    # transcription cost is roughly linear in audio duration, so silence
+    # is pure waste. 500ms keeps natural mid-sentence pauses intact.
+    segments, _info = model.transcribe(
+        audio_input,
+        language=LANG_TAMIL,
+        beam_size=1,
+        vad_filter=True,
+        vad_parameters={"min_silence_duration_ms": 500},
+    )
+
+    return _result_from_segments(segments)
+
+
+def speech_to_text_batch(
+    audio_inputs: List[Union[str, np.ndarray]],
+    model_size: str = "small",
+    batch_size: int = 8,
+) -> List[STTResult]:
+    """
+    Transcribe several utterances with faster-whisper's batched pipeline.
+
+    Batching packs audio chunks into one decoder call, amortizing model
+    launch overhead — worthwhile when this module is reused as a service
+    handling concurrent users or for offline evaluation runs. The live
+    demo is a single Streamlit session, so its per-turn path stays on
+    speech_to_text. Falls back to sequential transcription on
+    faster-whisper versions without BatchedInferencePipeline.
+    """
+    model = load_model(model_size)
+    pipeline = None
+    if BatchedInferencePipeline is not None:
+        pipeline = _BATCHED_PIPELINES.get(model_size)
+        if pipeline is None:
+            with _MODELS_LOCK:
+                pipeline = _BATCHED_PIPELINES.get(model_size)
+                if pipeline is None:
+                    pipeline = _BATCHED_PIPELINES[model_size] = (
+                        BatchedInferencePipeline(model)
+                    )
+
+    results = []
+    for audio_input in audio_inputs:
+        if isinstance(audio_input, str):
+            audio_input = _load_audio(audio_input)
+        if pipeline is not None:
+            segments, _info = pipeline.transcribe(
+                audio_input,
+                language=LANG_TAMIL,
+                batch_size=batch_size,
+                vad_filter=True,
+            )
+        else:
+            segments, _info = model.transcribe(
+                audio_input,
+                language=LANG_TAMIL,
+                beam_size=1,
+                vad_filter=True,
+                vad_parameters={"min_silence_duration_ms": 500},
+            )
+        results.append(_result_from_segments(segments))
+    return results
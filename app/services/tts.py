@@ -1,13 +1,201 @@
-import tempfile
+import io
+import os
+import re
+import threading
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator
+
 from gtts import gTTS
 
+try:
+    from piper import PiperVoice
+except ImportError:
+    PiperVoice = None  # Falls back to the gTTS network backend
+
 from app.config import LANG_TAMIL
 
+# Sentence boundaries (Latin + Indic terminators) and line breaks.
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.?!।॥])\s+|\n+")
+
+# gTTS calls are network-bound, so a small pool overlaps them well.
+_TTS_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tts")
+
+
+# Synthesized MP3 bytes keyed by text. The agent's prompts come from a
+# small fixed set (slot/document questions, canned messages), so repeat
+# turns become dict lookups instead of ~200-400ms gTTS round-trips.
+_TTS_CACHE: dict = {}
+_TTS_CACHE_MAX = 256
+
+
+# Optional local Piper voice: point PIPER_VOICE_PATH at a Tamil
+# ta_IN-*.onnx model (piper-tts installed) to synthesize on-CPU with no
+# network dependency. Loaded once per process.
+_PIPER_VOICE = None
+_PIPER_LOCK = threading.Lock()
+
+
+def _get_piper_voice():
+    """Return the loaded Piper voice, or None to use gTTS."""
+    global _PIPER_VOICE
+    if PiperVoice is None:
+        return None
+    voice_path = os.getenv("PIPER_VOICE_PATH")
+    if not voice_path:
+        return None
+    if _PIPER_VOICE is None:
+        with _PIPER_LOCK:
+            if _PIPER_VOICE is None:
+                try:
+                    _PIPER_VOICE = PiperVoice.load(voice_path)
+                except Exception:
+                    return None
+    return _PIPER_VOICE
+
+
+def audio_format() -> str:
+    """MIME type of the bytes text_to_speech produces (backend-dependent)."""
+    return "audio/wav" if _get_piper_voice() is not None else "audio/mp3"
+
+
+def _piper_bytes(voice, text: str) -> bytes:
+    """Synthesize with the local Piper voice into in-memory WAV bytes."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        voice.synthesize(text, wav_file)
+    return buf.getvalue()
+
+
+def _gtts_bytes(text: str) -> bytes:
+    """Uncached gTTS synthesis to in-memory MP3 bytes."""
+    buf = io.BytesIO()
+    gTTS(text=text, lang=LANG_TAMIL).write_to_fp(buf)
+    return buf.getvalue()
+
+
+def _synthesize(text: str) -> bytes:
+    """Route to the local Piper voice when configured, else gTTS."""
+    voice = _get_piper_voice()
+    if voice is not None:
+        try:
+            return _piper_bytes(voice, text)
+        except Exception:
+            pass  # Fall back to the network backend
+    return _gtts_bytes(text)
+
+
+def text_to_speech(text: str) -> bytes:
+    """Synthesize Tamil speech and return the MP3 bytes in memory."""
+    audio = _TTS_CACHE.get(text)
+    if audio is None:
+        if len(_TTS_CACHE) >= _TTS_CACHE_MAX:
+            _TTS_CACHE.clear()
+        audio = _TTS_CACHE[text] = _synthesize(text)
+    return audio
+
+
+def cached_audio(text: str) -> bytes | None:
+    """Return already-synthesized audio for text, or None on a cache miss.
+
+    Lets callers attach known-prewarmed audio (canned prompts) without
+    risking a synchronous synthesis on the miss path.
+    """
+    return _TTS_CACHE.get(text)
+
+
+def synthesize_async(text: str) -> "Future[bytes]":
+    """
+    Start synthesis on the shared pool and return a future of the bytes.
+
+    Lets callers kick off the (network-bound) TTS call as soon as the
+    response text is final and overlap it with their remaining work,
+    collecting the audio with .result() only when it is actually needed.
+    """
+    return _TTS_POOL.submit(text_to_speech, text)
+
+
+def prewarm_async(text: str) -> None:
+    """
+    Warm the TTS cache for text in the background (non-blocking).
+
+    Used to speculatively synthesize the question the agent will most
+    likely ask next while the user is still answering the current one.
+    """
+    if text in _TTS_CACHE:
+        return
+
+    def _warm() -> None:
+        try:
+            text_to_speech(text)
+        except Exception:
+            pass  # Purely speculative; first real use will synthesize.
+
+    _TTS_POOL.submit(_warm)
+
+
+def prewarm_static_prompts(extra_prompts: Iterable[str] = ()) -> None:
+    """
+    Pre-synthesize the finite set of static Tamil prompts in the background.
+
+    Covers every slot and document question plus any caller-supplied
+    canned strings. Non-blocking and best effort: each prompt is a pool
+    job, and a failed synthesis just means first real use pays the cost.
+    """
+    # Imported here: questions is a higher-level module than tts.
+    from app.services.questions import (
+        SLOT_QUESTION_TYPES,
+        ask_for_document,
+        ask_for_slot,
+    )
+    from app.services._schemes_cache import get_schemes
+
+    prompts = [ask_for_slot(slot) for slot in SLOT_QUESTION_TYPES]
+    documents = {
+        doc for scheme in get_schemes() for doc in scheme.get("required_documents", [])
+    }
+    prompts.extend(ask_for_document(doc) for doc in sorted(documents))
+    prompts.extend(p for p in extra_prompts if p)
+
+    for prompt in prompts:
+        prewarm_async(prompt)
+
+
+def stream_tts(text: str) -> Iterator[bytes]:
+    """
+    Yield MP3 bytes per sentence of the input, in order.
+
+    Sentences are synthesized concurrently, so playback of the first
+    chunk can start while later ones are still in flight instead of
+    waiting for the whole paragraph.
+    """
+    sentences = [s for s in _SENTENCE_SPLIT_RE.split(text) if s and s.strip()]
+    if len(sentences) <= 1:
+        yield text_to_speech(text)
+        return
+
+    futures = [_TTS_POOL.submit(text_to_speech, sentence) for sentence in sentences]
+    for future in futures:
+        yield future.result()
+
 
-def text_to_speech(text: str) -> str:
-    """Return path to a temp mp3 synthesized in Tamil."""
-    tts = gTTS(text=text, lang=LANG_TAMIL)
-    temp_mp3 = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
-    tts.save(temp_mp3.name)
-    return temp_mp3.name
+def text_to_speech_multiline(text: str) -> bytes:
+    """
+    Synthesize a multi-sentence response with per-sentence parallelism.
 
+    Each sentence becomes its own (cached) pool job via stream_tts, so an
+    N-bullet eligibility summary costs roughly one gTTS round-trip
+    instead of N sequential ones. MP3 frames concatenate into a valid
+    stream; the WAV-producing Piper backend keeps the single-shot path
+    since WAV chunks cannot simply be joined.
+    """
+    audio = _TTS_CACHE.get(text)
+    if audio is not None:
+        return audio
+    if _get_piper_voice() is not None:
+        return text_to_speech(text)
+    audio = b"".join(stream_tts(text))
+    if len(_TTS_CACHE) >= _TTS_CACHE_MAX:
+        _TTS_CACHE.clear()
+    _TTS_CACHE[text] = audio
+    return audio
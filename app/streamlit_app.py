@@ -4,25 +4,48 @@ This app demonstrates the full agentic workflow:
 STT → NLU → Memory → Planner → Tools → TTS
 """
 
+import hashlib
 import os
 import sys
 import json
-from typing import Dict, Any
+import tempfile
+from types import SimpleNamespace
+from typing import Any, Dict, NamedTuple, Optional
 
+import numpy as np
 import streamlit as st
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        # orjson emits UTF-8 directly; no ensure_ascii branching.
+        return orjson.dumps(obj, default=str).decode()
+
+except ImportError:
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
+
 # Ensure project root is on sys.path
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
 from app.agent_state import AgentState, update_state_from_nlu
-from app.planner import decide_next_action, PlannerAction, summarize_turn
-from app.services import audio, stt, tts, intent
+from app.planner import (
+    decide_next_action,
+    PlannerAction,
+    summarize_turn,
+    get_candidate_schemes,
+    get_required_slots_for_schemes,
+)
 from app.services.eligibility import check_eligibility
 from app.services.documents import (
     initialize_document_state,
     check_document_readiness,
+    apply_document_answer,
     get_required_documents,
 )
 from app.services.application import apply_for_scheme
@@ -44,6 +67,60 @@ st.set_page_config(
     layout="wide",
 )
 
+
+@st.cache_resource(show_spinner="Loading speech services...")
+def _services() -> SimpleNamespace:
+    """
+    Import the heavy service modules once, after the page shell exists.
+
+    audio/stt/tts/intent pull in sounddevice, faster-whisper, gTTS and
+    the Gemini client at import time; deferring them here keeps the
+    blank-page wait off streamlit's startup and lets the spinner show
+    while they load.
+    """
+    from app.services import audio, stt, tts, intent
+
+    return SimpleNamespace(audio=audio, stt=stt, tts=tts, intent=intent)
+
+
+_svc = _services()
+audio, stt, tts, intent = _svc.audio, _svc.stt, _svc.tts, _svc.intent
+
+
+# PlannerAction string values used in the per-turn dispatch; resolved
+# once instead of an enum attribute chain per comparison.
+_CHECK_DOCS = PlannerAction.CHECK_DOCUMENTS.value
+_CONFIRM_APP = PlannerAction.CONFIRM_APPLICATION.value
+_APPLY = PlannerAction.APPLY_SCHEME.value
+
+
+# Transparent step-by-step logging is the demo's default; set TNV_DEBUG=0
+# to strip the per-turn f-string/JSON debug work from the hot path.
+_DEBUG = os.getenv("TNV_DEBUG", "1") != "0"
+
+
+# Canned Tamil responses used verbatim in the turn loop; hoisted so the
+# TTS prewarm below and the branches share one copy.
+_REPEAT_TEXT = "மன்னிக்கவும், தெளிவாக கேட்க முடியவில்லை. தயவுசெய்து மீண்டும் சொல்லுங்கள்."
+_CANCEL_TEXT = "விண்ணப்பம் ரத்து செய்யப்பட்டது. நன்றி!"
+_NOT_ELIGIBLE_TEXT = "துரதிர்ஷ்டவசமாக, நீங்கள் தற்போது எந்த திட்டத்திற்கும் தகுதியானவர் அல்ல."
+_NEED_MORE_INFO_TEXT = "மேலும் தகவல் தேவை."
+
+
+@st.cache_resource
+def _warm_models() -> bool:
+    """Load and warm the STT model once per server process."""
+    stt.warmup()
+    # Canned prompts dominate this app's responses; fill the TTS cache
+    # for them in the background so their first use is a dict lookup.
+    tts.prewarm_static_prompts(
+        [_REPEAT_TEXT, _CANCEL_TEXT, _NOT_ELIGIBLE_TEXT, _NEED_MORE_INFO_TEXT]
+    )
+    return True
+
+
+_warm_models()
+
 # Initialize session state
 if "agent_state" not in st.session_state:
     st.session_state.agent_state = AgentState()
@@ -60,8 +137,61 @@ if "last_response_audio" not in st.session_state:
 if "auto_process_pending" not in st.session_state:
     st.session_state.auto_process_pending = False
 
-if "pending_audio_path" not in st.session_state:
-    st.session_state.pending_audio_path = None
+if "pending_audio" not in st.session_state:
+    st.session_state.pending_audio = None
+
+# Last spoken response, kept across turns (unlike last_response_audio,
+# which is cleared after autoplay) so identical follow-up responses --
+# re-asked questions, the "please repeat" fallback -- skip TTS entirely.
+if "last_response_text" not in st.session_state:
+    st.session_state.last_response_text = None
+
+if "last_response_tts" not in st.session_state:
+    st.session_state.last_response_tts = None
+
+
+class Turn(NamedTuple):
+    """One completed conversation turn, kept small for rerun rendering.
+
+    Response audio lives on tmpfs (see _spill_audio), not in session
+    state: holding the bytes for every turn made long sessions balloon
+    and every rerun copy the whole history.
+    """
+
+    user_text: str
+    nlu_result: Dict[str, Any]
+    planner_action: Optional[str]
+    agent_response: str
+    audio_path: Optional[str]
+    tool_called: Optional[str]
+    debug_steps: list
+    planner_info: Dict[str, Any]
+    filled_slots: Dict[str, Any]
+
+
+# RAM-backed when available so "spilling" is a memcpy, not disk I/O.
+_AUDIO_SPILL_DIR = os.path.join(
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+    "tn-voice-audio",
+)
+
+
+def _spill_audio(audio_bytes: Optional[bytes]) -> Optional[str]:
+    """Write response audio to a content-addressed file and return its path.
+
+    Content addressing deduplicates: the canned prompts that dominate
+    responses are written once per process no matter how often they
+    recur in the history.
+    """
+    if not audio_bytes:
+        return None
+    os.makedirs(_AUDIO_SPILL_DIR, exist_ok=True)
+    digest = hashlib.sha256(audio_bytes).hexdigest()[:32]
+    path = os.path.join(_AUDIO_SPILL_DIR, digest)
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(audio_bytes)
+    return path
 
 
 def format_slots(slots: Dict[str, Any]) -> Dict[str, Any]:
@@ -69,18 +199,187 @@ def format_slots(slots: Dict[str, Any]) -> Dict[str, Any]:
     return {k: v for k, v in slots.items() if v is not None}
 
 
+@st.cache_data(show_spinner=False)
+def _display_views(slots_items: tuple, docs_items: tuple):
+    """
+    Derived display state for the sidebar and footer.
+
+    Streamlit re-executes the whole script on every interaction; keying
+    this on immutable projections of the mutable state dicts means the
+    views are recomputed only when the agent state actually changes.
+    """
+    known_slots = {k: v for k, v in slots_items if v is not None}
+    doc_status = check_document_readiness(dict(docs_items)) if docs_items else None
+    return known_slots, doc_status
+
+
+# Built once at import: the sidebar re-renders on every rerun, so the
+# lookup table shouldn't be reallocated per call.
+_SCHEME_NAMES_TA = {
+    "CEN_IGNOAPS_001": "இந்திரா காந்தி தேசிய முதியோர் ஓய்வூதிய திட்டம்",
+    "CEN_PM_KISAN_001": "பிரதமர் கிசான் சம்மான் நிதி",
+    "CEN_PMMVY_001": "பிரதமர் மாத்ரு வந்தனா யோஜனா",
+}
+
+
 def get_scheme_name_ta(scheme_id: str) -> str:
     """Get Tamil name for a scheme."""
-    scheme_names = {
-        "CEN_IGNOAPS_001": "இந்திரா காந்தி தேசிய முதியோர் ஓய்வூதிய திட்டம்",
-        "CEN_PM_KISAN_001": "பிரதமர் கிசான் சம்மான் நிதி",
-        "CEN_PMMVY_001": "பிரதமர் மாத்ரு வந்தனா யோஜனா",
-    }
-    return scheme_names.get(scheme_id, scheme_id)
+    return _SCHEME_NAMES_TA.get(scheme_id, scheme_id)
+
+
+def _prewarm_next_slot_question(state: AgentState, current_slot: str) -> None:
+    """Speculatively synthesize the question we'll likely ask after current_slot.
+
+    Runs in the background while the user answers the current question, so
+    the next turn's TTS is usually a cache hit instead of a network call.
+    """
+    required = get_required_slots_for_schemes(get_candidate_schemes(state))
+    upcoming = next(
+        (s for s in required if s != current_slot and state.slots.get(s) is None),
+        None,
+    )
+    if upcoming:
+        tts.prewarm_async(ask_for_slot(upcoming))
+
+
+def _prewarm_next_document_question(documents: Dict[str, str], current_doc: str) -> None:
+    """Speculatively synthesize the next unknown document's question."""
+    upcoming = next(
+        (d for d, status in documents.items() if status == "unknown" and d != current_doc),
+        None,
+    )
+    if upcoming:
+        tts.prewarm_async(ask_for_document(upcoming))
+
+
+# --- Planner action handlers (Step 6) ---------------------------------
+# One function per PlannerAction, dispatched through _ACTION_HANDLERS
+# below instead of a long if/elif ladder. Each takes (state, info,
+# nlu_result, result) and returns (agent_response, tool_called); result
+# is passed only so handlers can append debug steps.
+
+
+def _handle_repeat_input(state, info, nlu_result, result):
+    if _DEBUG:
+        result["debug_steps"].append("   → Action: REPEAT_INPUT")
+    # The fallback line's audio is prewarmed at startup; attach it
+    # directly so the most frequent noisy-audio turn skips the TTS step.
+    cached = tts.cached_audio(_REPEAT_TEXT)
+    if cached is not None:
+        result["response_audio"] = cached
+    return _REPEAT_TEXT, None
+
+
+def _handle_contradiction_action(state, info, nlu_result, result):
+    contradictions = info.get("contradictions", [])
+    if not contradictions:
+        return "", None
+    slot = contradictions[0]
+    prev_val = state.slots.get(slot)
+    # Get new value from NLU
+    new_val = nlu_result.get("slots", {}).get(slot)
+    return handle_contradiction(slot, prev_val, new_val), "handle_contradiction"
+
+
+def _handle_ask_missing_slot(state, info, nlu_result, result):
+    slot = info.get("next_slot")
+    if not slot:
+        return "", None
+    agent_response = ask_for_slot(slot)
+    _prewarm_next_slot_question(state, slot)
+    return agent_response, f"ask_for_slot({slot})"
+
+
+def _handle_check_eligibility(state, info, nlu_result, result):
+    if _DEBUG:
+        result["debug_steps"].append("   → Action: CHECK_ELIGIBILITY")
+    eligible_schemes = check_eligibility(state.slots)
+    if _DEBUG:
+        result["debug_steps"].append(f"   ✓ Eligible schemes found: {len(eligible_schemes)}")
+    state.eligibility_checked = True
+    state.eligible_schemes = [s["scheme_id"] for s in eligible_schemes]
+
+    if eligible_schemes:
+        lines = ["நீங்கள் தகுதியான திட்டங்கள்:"]
+        lines.extend(
+            f"• {get_scheme_name_ta(s['scheme_id'])}: {s['reason_ta']}"
+            for s in eligible_schemes
+        )
+        agent_response = "\n".join(lines)
+    else:
+        agent_response = _NOT_ELIGIBLE_TEXT
+
+    return agent_response, "check_eligibility"
+
+
+def _handle_check_documents(state, info, nlu_result, result):
+    # Initialize documents if needed
+    if not state.documents and state.eligible_schemes:
+        scheme_id = state.eligible_schemes[0]
+        state.documents = initialize_document_state(scheme_id)
 
+    doc_status = check_document_readiness(state.documents)
 
-def process_user_input(audio_path: str) -> Dict[str, Any]:
-    """Process user voice input through full agent pipeline."""
+    if doc_status["status"] == "checking":
+        next_doc = doc_status["next_doc"]
+        agent_response = ask_for_document(next_doc)
+        _prewarm_next_document_question(state.documents, next_doc)
+        state.last_action = _CHECK_DOCS
+        return agent_response, f"ask_for_document({next_doc})"
+
+    if doc_status["status"] == "missing":
+        missing_docs = doc_status["missing_docs"]
+        if missing_docs and state.eligible_schemes:
+            scheme_id = state.eligible_schemes[0]
+            scheme_name_ta = get_scheme_name_ta(scheme_id)
+            agent_response = explain_missing_document(missing_docs[0], scheme_name_ta)
+            return agent_response, f"explain_missing_document({missing_docs[0]})"
+
+    return "", None
+
+
+def _handle_confirm_application(state, info, nlu_result, result):
+    if not state.eligible_schemes:
+        return "", None
+    scheme_id = state.eligible_schemes[0]
+    scheme_name_ta = get_scheme_name_ta(scheme_id)
+    state.last_action = _CONFIRM_APP
+    return confirm_application(scheme_name_ta), "confirm_application"
+
+
+def _handle_apply_scheme(state, info, nlu_result, result):
+    if not state.eligible_schemes:
+        return "", None
+    scheme_id = state.eligible_schemes[0]
+    app_result = apply_for_scheme(scheme_id, state.slots)
+    state.application_started = True
+    state.application_id = app_result["application_id"]
+    state.last_action = _APPLY
+    agent_response = application_success_message(app_result["application_id"])
+    return agent_response, f"apply_for_scheme({scheme_id})"
+
+
+def _handle_respond_result(state, info, nlu_result, result):
+    if state.eligible_schemes:
+        scheme_names = [get_scheme_name_ta(sid) for sid in state.eligible_schemes]
+        return f"நீங்கள் தகுதியான திட்டங்கள்: {', '.join(scheme_names)}", None
+    return _NEED_MORE_INFO_TEXT, None
+
+
+_ACTION_HANDLERS = {
+    PlannerAction.REPEAT_INPUT: _handle_repeat_input,
+    PlannerAction.HANDLE_CONTRADICTION: _handle_contradiction_action,
+    PlannerAction.ASK_MISSING_SLOT: _handle_ask_missing_slot,
+    PlannerAction.CHECK_ELIGIBILITY: _handle_check_eligibility,
+    PlannerAction.CHECK_DOCUMENTS: _handle_check_documents,
+    PlannerAction.CONFIRM_APPLICATION: _handle_confirm_application,
+    PlannerAction.APPLY_SCHEME: _handle_apply_scheme,
+    PlannerAction.RESPOND_RESULT: _handle_respond_result,
+}
+
+
+def process_user_input(audio_input: np.ndarray) -> Dict[str, Any]:
+    """Process user voice input (float32 mono samples) through full agent pipeline."""
     result = {
         "user_text": "",
         "nlu_result": {},
@@ -94,55 +393,70 @@ def process_user_input(audio_path: str) -> Dict[str, Any]:
 
     try:
         # Step 1: STT
-        result["debug_steps"].append("🔊 Step 1: STT (Speech-to-Text)")
-        user_text, stt_confidence = stt.speech_to_text(audio_path)
+        if _DEBUG:
+            result["debug_steps"].append("🔊 Step 1: STT (Speech-to-Text)")
+        stt_result = stt.speech_to_text(audio_input)
+        user_text = stt_result.text
+        stt_confidence = stt_result.confidence
         result["user_text"] = user_text
-        result["debug_steps"].append(f"   ✓ Recognized: '{user_text}'")
-        result["debug_steps"].append(f"   ✓ STT Confidence: {stt_confidence:.2f}")
+        if _DEBUG:
+            result["debug_steps"].append(f"   ✓ Recognized: '{user_text}'")
+            result["debug_steps"].append(f"   ✓ STT Confidence: {stt_confidence:.2f}")
 
         if len(user_text.strip()) < 3:
             result["error"] = "Speech not clear. Please try again."
-            result["debug_steps"].append(f"   ✗ Error: Text too short")
+            if _DEBUG:
+                result["debug_steps"].append(f"   ✗ Error: Text too short")
             return result
 
         # Step 2: NLU (Intent + Slots)
-        result["debug_steps"].append("🧠 Step 2: NLU (Intent + Slot Extraction)")
+        if _DEBUG:
+            result["debug_steps"].append("🧠 Step 2: NLU (Intent + Slot Extraction)")
         nlu_result = intent.extract_intent_and_slots(user_text)
         result["nlu_result"] = nlu_result
-        result["debug_steps"].append(f"   ✓ Intent: {nlu_result.get('intent')}")
-        result["debug_steps"].append(f"   ✓ Slots: {json.dumps({k: v for k, v in nlu_result.get('slots', {}).items() if v is not None}, ensure_ascii=False)}")
+        # Non-None slot projection, computed once and reused by the debug
+        # log here and the history rendering (via the turn record).
+        filled_slots = {k: v for k, v in nlu_result.get("slots", {}).items() if v is not None}
+        result["filled_slots"] = filled_slots
+        if _DEBUG:
+            result["debug_steps"].append(f"   ✓ Intent: {nlu_result.get('intent')}")
+            result["debug_steps"].append(f"   ✓ Slots: {_dumps(filled_slots)}")
 
         # Step 3: Update Memory
-        result["debug_steps"].append("💾 Step 3: Update Memory")
+        if _DEBUG:
+            result["debug_steps"].append("💾 Step 3: Update Memory")
         state = st.session_state.agent_state
         update_state_from_nlu(state, nlu_result)
-        result["debug_steps"].append(f"   ✓ State updated: Intent={state.intent}, Slots filled={len([k for k, v in state.slots.items() if v is not None])}")
+        if _DEBUG:
+            result["debug_steps"].append(f"   ✓ State updated: Intent={state.intent}, Slots filled={len([k for k, v in state.slots.items() if v is not None])}")
 
         # Step 4: Check for document/application responses FIRST (bypass STT confidence check)
-        result["debug_steps"].append("🎯 Step 4: Check Context (Document/Application)")
+        if _DEBUG:
+            result["debug_steps"].append("🎯 Step 4: Check Context (Document/Application)")
         agent_response = ""
         tool_called = None
         handled_by_context = False
         context_action = None
 
         # Check if we're waiting for a document response (last action was CHECK_DOCUMENTS)
-        if state.last_action == PlannerAction.CHECK_DOCUMENTS.value and state.documents:
+        if state.last_action == _CHECK_DOCS and state.documents:
             doc_status = check_document_readiness(state.documents)
             if doc_status["status"] == "checking":
                 next_doc = doc_status["next_doc"]
                 # Extract yes/no from user speech (even with low STT confidence)
                 yes_no = extract_yes_no_from_tamil(user_text)
                 if yes_no:
-                    result["debug_steps"].append(f"   ✓ Document response detected: {yes_no} for {next_doc} (bypassed STT confidence check)")
-                    state.documents[next_doc] = yes_no
-                    # Re-check document status after update
-                    doc_status = check_document_readiness(state.documents)
+                    if _DEBUG:
+                        result["debug_steps"].append(f"   ✓ Document response detected: {yes_no} for {next_doc} (bypassed STT confidence check)")
+                    # Record the answer and get the new status in one step
+                    doc_status = apply_document_answer(state.documents, next_doc, yes_no)
                     if doc_status["status"] == "checking":
                         # Ask next document
                         next_doc = doc_status["next_doc"]
                         agent_response = ask_for_document(next_doc)
                         tool_called = f"ask_for_document({next_doc})"
-                        state.last_action = PlannerAction.CHECK_DOCUMENTS.value
+                        _prewarm_next_document_question(state.documents, next_doc)
+                        state.last_action = _CHECK_DOCS
                         context_action = PlannerAction.CHECK_DOCUMENTS
                         handled_by_context = True
                     elif doc_status["status"] == "missing":
@@ -160,33 +474,34 @@ def process_user_input(audio_path: str) -> Dict[str, Any]:
                             scheme_name_ta = get_scheme_name_ta(scheme_id)
                             agent_response = confirm_application(scheme_name_ta)
                             tool_called = "confirm_application"
-                            state.last_action = PlannerAction.CONFIRM_APPLICATION.value
+                            state.last_action = _CONFIRM_APP
                             context_action = PlannerAction.CONFIRM_APPLICATION
                             handled_by_context = True
                 else:
                     # Didn't understand yes/no, ask again (but don't fail due to low STT confidence)
                     agent_response = ask_for_document(next_doc)
                     tool_called = f"ask_for_document({next_doc})"
-                    result["debug_steps"].append(f"   → Could not extract yes/no, re-asking (bypassed STT confidence)")
+                    if _DEBUG:
+                        result["debug_steps"].append(f"   → Could not extract yes/no, re-asking (bypassed STT confidence)")
                     handled_by_context = True
         
         # Check if waiting for application confirmation (last action was CONFIRM_APPLICATION)
-        if not handled_by_context and state.last_action == PlannerAction.CONFIRM_APPLICATION.value and not state.application_started:
+        if not handled_by_context and state.last_action == _CONFIRM_APP and not state.application_started:
             # User might be confirming application
             yes_no = extract_yes_no_from_tamil(user_text)
             if yes_no == "yes":
                 # Apply for scheme
                 scheme_id = state.eligible_schemes[0]
-                result = apply_for_scheme(scheme_id, state.slots)
+                app_result = apply_for_scheme(scheme_id, state.slots)
                 state.application_started = True
-                state.application_id = result["application_id"]
-                agent_response = application_success_message(result["application_id"])
+                state.application_id = app_result["application_id"]
+                agent_response = application_success_message(app_result["application_id"])
                 tool_called = f"apply_for_scheme({scheme_id})"
-                state.last_action = PlannerAction.APPLY_SCHEME.value
+                state.last_action = _APPLY
                 context_action = PlannerAction.APPLY_SCHEME
                 handled_by_context = True
             elif yes_no == "no":
-                agent_response = "விண்ணப்பம் ரத்து செய்யப்பட்டது. நன்றி!"
+                agent_response = _CANCEL_TEXT
                 tool_called = "cancel_application"
                 handled_by_context = True
             else:
@@ -195,7 +510,8 @@ def process_user_input(audio_path: str) -> Dict[str, Any]:
                 scheme_name_ta = get_scheme_name_ta(scheme_id)
                 agent_response = confirm_application(scheme_name_ta)
                 tool_called = "confirm_application"
-                result["debug_steps"].append(f"   → Could not extract yes/no for application confirmation, re-asking")
+                if _DEBUG:
+                    result["debug_steps"].append(f"   → Could not extract yes/no for application confirmation, re-asking")
                 handled_by_context = True
 
         # Set planner_action for context-handled cases
@@ -203,118 +519,87 @@ def process_user_input(audio_path: str) -> Dict[str, Any]:
             result["planner_action"] = context_action
             result["planner_info"] = {"handled_by_context": True}
 
+        # TTS is network-bound; start synthesizing as soon as the response
+        # text is final so it overlaps the bookkeeping below instead of
+        # running strictly after it. When the response repeats the
+        # previous turn's text verbatim, its audio is reused instead.
+        def _last_tts_for(text):
+            if text and text == st.session_state.last_response_text:
+                return st.session_state.last_response_tts
+            return None
+
+        tts_future = None
+        if handled_by_context and agent_response and _last_tts_for(agent_response) is None:
+            tts_future = tts.synthesize_async(agent_response)
+
         # Step 5: Planner Decision (only if not handled by context)
         if not handled_by_context:
-            result["debug_steps"].append("🎯 Step 5: Planner Decision")
+            if _DEBUG:
+                result["debug_steps"].append("🎯 Step 5: Planner Decision")
             # Use actual STT confidence, not NLU confidence
-            action, info = decide_next_action(state, stt_confidence)
+            action, info = decide_next_action(state, stt_confidence, debug=_DEBUG)
             result["planner_action"] = action
             result["planner_info"] = info
-            result["debug_steps"].append(f"   ✓ Action: {action.value}")
-            result["debug_steps"].append(f"   ✓ Info: {json.dumps(info, ensure_ascii=False, default=str)}")
+            if _DEBUG:
+                result["debug_steps"].append(f"   ✓ Action: {action.value}")
+                result["debug_steps"].append(f"   ✓ Info: {_dumps(info)}")
 
             # Step 6: Execute Action
-            result["debug_steps"].append("⚙️ Step 6: Execute Action")
+            if _DEBUG:
+                result["debug_steps"].append("⚙️ Step 6: Execute Action")
             
-            if action == PlannerAction.REPEAT_INPUT:
-                result["debug_steps"].append("   → Action: REPEAT_INPUT")
-                agent_response = "மன்னிக்கவும், தெளிவாக கேட்க முடியவில்லை. தயவுசெய்து மீண்டும் சொல்லுங்கள்."
-
-            elif action == PlannerAction.HANDLE_CONTRADICTION:
-                contradictions = info.get("contradictions", [])
-                if contradictions:
-                    slot = contradictions[0]
-                    prev_val = state.slots.get(slot)
-                    # Get new value from NLU
-                    new_val = nlu_result.get("slots", {}).get(slot)
-                    agent_response = handle_contradiction(slot, prev_val, new_val)
-                    tool_called = "handle_contradiction"
-
-            elif action == PlannerAction.ASK_MISSING_SLOT:
-                slot = info.get("next_slot")
-                if slot:
-                    agent_response = ask_for_slot(slot)
-                    tool_called = f"ask_for_slot({slot})"
-
-            elif action == PlannerAction.CHECK_ELIGIBILITY:
-                result["debug_steps"].append("   → Action: CHECK_ELIGIBILITY")
-                eligible_schemes = check_eligibility(state.slots)
-                result["debug_steps"].append(f"   ✓ Eligible schemes found: {len(eligible_schemes)}")
-                state.eligibility_checked = True
-                state.eligible_schemes = [s["scheme_id"] for s in eligible_schemes]
-
-                if eligible_schemes:
-                    scheme_names = [get_scheme_name_ta(s["scheme_id"]) for s in eligible_schemes]
-                    reasons = [s["reason_ta"] for s in eligible_schemes]
-                    agent_response = f"நீங்கள் தகுதியான திட்டங்கள்:\n"
-                    for name, reason in zip(scheme_names, reasons):
-                        agent_response += f"• {name}: {reason}\n"
-                else:
-                    agent_response = "துரதிர்ஷ்டவசமாக, நீங்கள் தற்போது எந்த திட்டத்திற்கும் தகுதியானவர் அல்ல."
-
-                tool_called = "check_eligibility"
-
-            elif action == PlannerAction.CHECK_DOCUMENTS:
-                # Initialize documents if needed
-                if not state.documents and state.eligible_schemes:
-                    scheme_id = state.eligible_schemes[0]
-                    state.documents = initialize_document_state(scheme_id)
-
-                doc_status = check_document_readiness(state.documents)
-
-                if doc_status["status"] == "checking":
-                    next_doc = doc_status["next_doc"]
-                    agent_response = ask_for_document(next_doc)
-                    tool_called = f"ask_for_document({next_doc})"
-                    state.last_action = PlannerAction.CHECK_DOCUMENTS.value
-
-                elif doc_status["status"] == "missing":
-                    missing_docs = doc_status["missing_docs"]
-                    if missing_docs and state.eligible_schemes:
-                        scheme_id = state.eligible_schemes[0]
-                        scheme_name_ta = get_scheme_name_ta(scheme_id)
-                        agent_response = explain_missing_document(missing_docs[0], scheme_name_ta)
-                        tool_called = f"explain_missing_document({missing_docs[0]})"
-
-            elif action == PlannerAction.CONFIRM_APPLICATION:
-                if state.eligible_schemes:
-                    scheme_id = state.eligible_schemes[0]
-                    scheme_name_ta = get_scheme_name_ta(scheme_id)
-                    agent_response = confirm_application(scheme_name_ta)
-                    tool_called = "confirm_application"
-                    state.last_action = PlannerAction.CONFIRM_APPLICATION.value
-
-            elif action == PlannerAction.APPLY_SCHEME:
-                if state.eligible_schemes:
-                    scheme_id = state.eligible_schemes[0]
-                    result = apply_for_scheme(scheme_id, state.slots)
-                    state.application_started = True
-                    state.application_id = result["application_id"]
-                    agent_response = application_success_message(result["application_id"])
-                    tool_called = f"apply_for_scheme({scheme_id})"
-                    state.last_action = PlannerAction.APPLY_SCHEME.value
-
-            elif action == PlannerAction.RESPOND_RESULT:
-                if state.eligible_schemes:
-                    scheme_names = [get_scheme_name_ta(sid) for sid in state.eligible_schemes]
-                    agent_response = f"நீங்கள் தகுதியான திட்டங்கள்: {', '.join(scheme_names)}"
-                else:
-                    agent_response = "மேலும் தகவல் தேவை."
+            handler = _ACTION_HANDLERS.get(action)
+            if handler is not None:
+                agent_response, tool_called = handler(state, info, nlu_result, result)
+
+            # Multi-line responses (eligibility summaries) go through the
+            # per-sentence parallel path below instead of one pool job.
+            if (
+                agent_response
+                and result["response_audio"] is None
+                and "\n" not in agent_response
+                and _last_tts_for(agent_response) is None
+            ):
+                tts_future = tts.synthesize_async(agent_response)
 
         result["agent_response"] = agent_response
         result["tool_called"] = tool_called
-        result["debug_steps"].append(f"   ✓ Response generated: {len(agent_response)} chars")
+        if _DEBUG:
+            result["debug_steps"].append(f"   ✓ Response generated: {len(agent_response)} chars")
 
         # Step 6: TTS
-        if agent_response:
-            result["debug_steps"].append("🔊 Step 6: TTS (Text-to-Speech)")
-            response_audio = tts.text_to_speech(agent_response)
-            result["response_audio"] = response_audio
-            result["debug_steps"].append("   ✓ Audio generated")
+        if result["response_audio"] is not None:
+            # Attached by a handler from the prewarmed cache; nothing to do.
+            if _DEBUG:
+                result["debug_steps"].append("🔊 Step 6: TTS (Text-to-Speech)")
+                result["debug_steps"].append("   ✓ Audio attached from prewarmed cache")
+        elif tts_future is not None:
+            if _DEBUG:
+                result["debug_steps"].append("🔊 Step 6: TTS (Text-to-Speech)")
+            result["response_audio"] = tts_future.result()
+            if _DEBUG:
+                result["debug_steps"].append("   ✓ Audio generated")
+        elif agent_response:
+            if _DEBUG:
+                result["debug_steps"].append("🔊 Step 6: TTS (Text-to-Speech)")
+            reused = _last_tts_for(agent_response)
+            if reused is not None:
+                result["response_audio"] = reused
+                if _DEBUG:
+                    result["debug_steps"].append("   ✓ Audio reused from previous turn (same text)")
+            else:
+                result["response_audio"] = tts.text_to_speech_multiline(agent_response)
+                if _DEBUG:
+                    result["debug_steps"].append("   ✓ Audio generated (per-sentence parallel)")
+
+        if result["response_audio"] is not None:
+            st.session_state.last_response_text = agent_response
+            st.session_state.last_response_tts = result["response_audio"]
 
     except Exception as e:
         result["error"] = str(e)
-        result["debug_steps"].append(f"   ✗ ERROR: {str(e)}")
+        if _DEBUG:
+            result["debug_steps"].append(f"   ✗ ERROR: {str(e)}")
         import traceback
         result["traceback"] = traceback.format_exc()
 
@@ -328,14 +613,16 @@ st.markdown("**Agentic AI System for Government Welfare Scheme Assistance**")
 # Sidebar - State Display
 with st.sidebar:
     st.header("📊 Agent State")
-    
+
     state = st.session_state.agent_state
-    
+    known_slots, cached_doc_status = _display_views(
+        tuple(state.slots.items()), tuple(state.documents.items())
+    )
+
     st.subheader("Intent")
     st.write(state.intent or "None")
-    
+
     st.subheader("Known Slots")
-    known_slots = format_slots(state.slots)
     if known_slots:
         st.json(known_slots)
     else:
@@ -384,49 +671,50 @@ with col1:
     
     # Display conversation history
     for i, turn in enumerate(st.session_state.conversation_history):
-        with st.expander(f"Turn {i+1}: {turn.get('planner_action', 'N/A')}", expanded=(i == len(st.session_state.conversation_history) - 1)):
+        with st.expander(f"Turn {i+1}: {turn.planner_action or 'N/A'}", expanded=(i == len(st.session_state.conversation_history) - 1)):
             st.markdown("**User:**")
-            st.write(turn.get("user_text", ""))
-            
+            st.write(turn.user_text)
+
             st.markdown("**Agent:**")
-            st.write(turn.get("agent_response", ""))
-            
-            if turn.get("response_audio"):
-                st.audio(turn["response_audio"])
-            
+            st.write(turn.agent_response)
+
+            if turn.audio_path:
+                st.audio(turn.audio_path, format=tts.audio_format())
+
             # Debug information
-            if turn.get("debug_steps"):
+            if turn.debug_steps:
                 with st.expander("🔍 Debug Steps", expanded=False):
-                    for step in turn["debug_steps"]:
+                    for step in turn.debug_steps:
                         st.text(step)
-            
+
             st.markdown("**NLU Result:**")
-            nlu = turn.get("nlu_result", {})
+            nlu = turn.nlu_result
             st.json({
                 "intent": nlu.get("intent"),
-                "slots": {k: v for k, v in nlu.get("slots", {}).items() if v is not None},
+                "slots": turn.filled_slots,
                 "confidence": nlu.get("confidence"),
             })
-            
+
             st.markdown("**Planner Decision:**")
-            st.code(turn.get("planner_action", ""))
-            
-            if turn.get("planner_info"):
+            st.code(turn.planner_action or "")
+
+            if turn.planner_info:
                 st.markdown("**Planner Info:**")
-                st.json(turn["planner_info"])
-            
-            if turn.get("tool_called"):
+                st.json(turn.planner_info)
+
+            if turn.tool_called:
                 st.markdown("**Tool Called:**")
-                st.code(turn["tool_called"])
+                st.code(turn.tool_called)
 
 with col2:
     st.header("🎤 Voice Input")
     
     # Auto-process if we have pending audio
-    if st.session_state.auto_process_pending and st.session_state.pending_audio_path:
+    if st.session_state.auto_process_pending and st.session_state.pending_audio is not None:
         with st.spinner("Processing..."):
-            result = process_user_input(st.session_state.pending_audio_path)
-            
+            result = process_user_input(st.session_state.pending_audio)
+            st.session_state.pending_audio = None
+
             if result["error"]:
                 st.error(f"❌ Error: {result['error']}")
                 if result.get("debug_steps"):
@@ -437,30 +725,29 @@ with col2:
                     with st.expander("🔍 Full Traceback"):
                         st.code(result["traceback"])
                 st.session_state.auto_process_pending = False
-                st.session_state.pending_audio_path = None
             else:
                 # Add to conversation history
-                turn = {
-                    "user_text": result["user_text"],
-                    "nlu_result": result["nlu_result"],
-                    "planner_action": result["planner_action"].value if result["planner_action"] else None,
-                    "agent_response": result["agent_response"],
-                    "response_audio": result["response_audio"],
-                    "tool_called": result["tool_called"],
-                    "debug_steps": result.get("debug_steps", []),
-                    "planner_info": result.get("planner_info", {}),
-                }
+                turn = Turn(
+                    user_text=result["user_text"],
+                    nlu_result=result["nlu_result"],
+                    planner_action=result["planner_action"].value if result["planner_action"] else None,
+                    agent_response=result["agent_response"],
+                    audio_path=_spill_audio(result["response_audio"]),
+                    tool_called=result["tool_called"],
+                    debug_steps=result.get("debug_steps", []),
+                    planner_info=result.get("planner_info", {}),
+                    filled_slots=result.get("filled_slots", {}),
+                )
                 st.session_state.conversation_history.append(turn)
                 st.session_state.last_response_audio = result["response_audio"]
                 st.session_state.auto_process_pending = False
-                st.session_state.pending_audio_path = None
                 st.rerun()
     
     if st.button("🎙️ Start Recording", type="primary", use_container_width=True):
         with st.spinner("Recording... Speak now"):
-            audio_path = audio.record_until_silence()
-            if audio_path:
-                st.session_state.pending_audio_path = audio_path
+            audio_data = audio.record_until_silence()
+            if audio_data is not None:
+                st.session_state.pending_audio = audio_data
                 st.session_state.auto_process_pending = True
                 st.success("✅ Recording complete! Processing automatically...")
                 st.rerun()
@@ -469,16 +756,15 @@ with col2:
     
     # Auto-play last response audio
     if st.session_state.last_response_audio:
-        st.audio(st.session_state.last_response_audio, autoplay=True)
+        st.audio(st.session_state.last_response_audio, format=tts.audio_format(), autoplay=True)
         # Clear after playing (prevent re-playing on rerun)
         if not st.session_state.auto_process_pending:
             st.session_state.last_response_audio = None
 
 # Document status display (informational only - voice-based interaction)
-if st.session_state.agent_state.documents:
-    doc_status = check_document_readiness(st.session_state.agent_state.documents)
-    if doc_status["status"] == "checking":
-        next_doc = doc_status["next_doc"]
+if cached_doc_status is not None:
+    if cached_doc_status["status"] == "checking":
+        next_doc = cached_doc_status["next_doc"]
         st.info(f"💬 Waiting for voice response about: {next_doc}")
         st.caption("Say 'ஆம்' (yes) or 'இல்லை' (no) when asked")
 